@@ -1,49 +1,92 @@
 import random  # Importa il modulo random, usato per mescolare le carte e generare casualità nel gioco
 from colorama import init, Fore, Style  # Importa le funzioni e costanti di colorama per colorare il testo nel terminale
 import re  # Importa il modulo re, usato per le espressioni regolari (ad esempio per rimuovere i codici colore ANSI)
+import sys  # Importa il modulo sys, usato per scrivere l'output del tavolo in un'unica chiamata
 
 # --- Costanti ---
 SEMI = ['♠', '♥', '♦', '♣']  # Lista dei semi delle carte
 VALORI = ['A'] + [str(n) for n in range(2, 11)] + ['J', 'Q', 'K']  # Lista dei valori delle carte
 COLORI = {'♠': 'N', '♣': 'N', '♥': 'R', '♦': 'R'}  # Dizionario che associa ogni seme al suo colore
+INDICE_VALORE = {valore: i for i, valore in enumerate(VALORI)}  # Mappa valore -> rank: lookup O(1) al posto della ricerca lineare in VALORI
+INDICE_SEME = {seme: i for i, seme in enumerate(SEMI)}  # Mappa seme -> indice: lookup O(1) al posto della ricerca lineare in SEMI
+# Le 52 combinazioni valore/seme, calcolate una volta sola a livello di modulo:
+# ogni nuovo Mazzo costruisce le sue carte da questa lista invece di rifare il
+# doppio ciclo su SEMI e VALORI a ogni partita. (Le Carta restano istanze nuove
+# perché lo stato coperta/scoperta è mutabile e non può essere condiviso.)
+MAZZO_BASE = [(valore, seme) for seme in SEMI for valore in VALORI]
+# Generatore di numeri casuali dedicato al gioco: evita di passare dalle
+# funzioni di modulo di random (che incapsulano un'istanza globale condivisa)
+# e permette, volendo, di fissare un seme riproducibile in un punto solo.
+RNG = random.Random()
+
+
+def _costruisci_can_stack():
+    # Costruisce la tabella di legalità 52x52 per l'impilamento in colonna:
+    # il bit `d` di tabella[s] vale 1 se la carta con id `s` può essere
+    # appoggiata sulla carta con id `d` (colori alternati, valore -1).
+    # L'id di una carta è seme*13 + rank, come calcolato in Carta.__init__.
+    tabella = [0] * 52
+    for s_id in range(52):
+        colore_s = COLORI[SEMI[s_id // 13]]
+        rank_s = s_id % 13
+        for d_id in range(52):
+            colore_d = COLORI[SEMI[d_id // 13]]
+            rank_d = d_id % 13
+            if colore_s != colore_d and rank_d == rank_s + 1:
+                tabella[s_id] |= 1 << d_id
+    return tabella
+
+
+# Tabella di legalità precalcolata una volta sola all'import del modulo
+CAN_STACK = _costruisci_can_stack()
 
 # =============================================================================
 # --- Classe Carta ---
 # =============================================================================
 class Carta:
+    __slots__ = ('valore', 'seme', 'coperta', 'rank', 'suit', 'color', 'num', 'id', 'testo', 'resa')  # Niente __dict__: meno memoria e accesso agli attributi più rapido
+
     def __init__(self, valore, seme, coperta=True):  # Costruttore della carta
         self.valore = valore  # Valore della carta (A, 2-10, J, Q, K)
         self.seme = seme      # Seme della carta (♠, ♥, ♦, ♣)
         self.coperta = coperta  # True se la carta è coperta, False se scoperta
+        # Codifica numerica precalcolata una volta sola: evita ricerche lineari
+        # in VALORI e confronti tra stringhe Unicode nei controlli delle mosse
+        self.rank = INDICE_VALORE[valore]  # Posizione del valore (0=A ... 12=K)
+        self.suit = INDICE_SEME[seme]      # Indice del seme (0=♠, 1=♥, 2=♦, 3=♣)
+        self.color = 1 if COLORI[seme] == 'R' else 0  # Bit colore: 1=rosso, 0=nero
+        self.num = self.rank + 1  # Valore numerico (A=1 ... K=13): VALORI è ordinato, quindi basta rank+1
+        self.id = self.suit * 13 + self.rank  # Identificatore univoco 0-51, usato come indice nelle tabelle precalcolate
+        self.testo = f"[{valore}{seme}]"  # Testo senza codici colore, pronto per i calcoli di larghezza
+        colore_ansi = Fore.RED if self.color else Fore.WHITE  # Codice colore del terminale per questa carta
+        self.resa = f"{colore_ansi}{self.testo}{Style.RESET_ALL}"  # Resa colorata costruita una volta sola
 
     def __str__(self):  # Rappresentazione testuale della carta
-        if self.coperta:
-            return "[#]"
-        color = Fore.RED if self.seme in ['♥', '♦'] else Fore.WHITE
-        return f"{color}[{self.valore}{self.seme}]{Style.RESET_ALL}"
+        return "[#]" if self.coperta else self.resa  # Nessuna concatenazione: la resa colorata è precalcolata
 
     def colore(self):  # Restituisce il colore della carta
-        return COLORI[self.seme]  # Usa il dizionario COLORI per determinare il colore
+        return 'R' if self.color else 'N'  # Legge il bit colore precalcolato
 
     def valore_num(self):  # Restituisce il valore numerico della carta
-        if self.valore == 'A':  # Asso vale 1
-            return 1
-        if self.valore == 'J':  # Jack vale 11
-            return 11
-        if self.valore == 'Q':  # Regina vale 12
-            return 12
-        if self.valore == 'K':  # Re vale 13
-            return 13
-        return int(self.valore)  # Per i numeri da 2 a 10
+        return self.num  # Precalcolato in __init__, niente catena di if a ogni chiamata
+
+
+def puo_impilare(sopra, sotto):
+    # Regola unica di impilamento sulle colonne (colori alternati e valore
+    # immediatamente inferiore), risolta con un solo test di bit nella
+    # tabella CAN_STACK precalcolata all'import.
+    return (CAN_STACK[sopra.id] >> sotto.id) & 1
 
 
 # =============================================================================
 # --- Classe Mazzo (riserva) ---
 # =============================================================================
 class Mazzo:
+    __slots__ = ('carte',)  # Niente __dict__ per istanza
+
     def __init__(self):  # Costruttore del mazzo
-        self.carte = [Carta(val, seme) for seme in SEMI for val in VALORI]  # Crea tutte le carte
-        random.shuffle(self.carte)  # Mescola le carte
+        self.carte = [Carta(val, seme) for val, seme in MAZZO_BASE]  # Crea tutte le carte dalla tabella precalcolata
+        RNG.shuffle(self.carte)  # Mescola le carte
 
     def pesca(self):  # Pesca una carta dal mazzo
         return self.carte.pop() if self.carte else None  # Rimuove e restituisce l'ultima carta, None se vuoto
@@ -59,7 +102,7 @@ class Mazzo:
         """
         if scarti:  # Solo se ci sono carte negli scarti da rimescolare
             self.carte.extend(scarti[:])  # Aggiunge una copia degli scarti al mazzo esistente (invece di sostituire)
-            random.shuffle(self.carte)  # Mescola di nuovo tutto il mazzo (carte esistenti + scarti)
+            RNG.shuffle(self.carte)  # Mescola di nuovo tutto il mazzo (carte esistenti + scarti)
             scarti.clear()  # Svuota la lista degli scarti dopo averla aggiunta al mazzo
             print(f"Rimescolate {len(scarti)} carte dagli scarti nel mazzo! Mazzo ora: {len(self.carte)} carte")  # Messaggio informativo dettagliato
         else:
@@ -86,68 +129,76 @@ class Mazzo:
 # --- Classe Tavolo (colonne di gioco) ---
 # =============================================================================
 class Tavolo:
+    __slots__ = ('colonne', 'coperte')  # Niente __dict__ per istanza
+
     def __init__(self, mazzo):  # Costruttore del tavolo
         self.colonne = [[] for _ in range(7)]  # Crea 7 colonne vuote
+        self.coperte = [0] * 7  # Quante carte coperte restano in fondo a ogni colonna
         for i in range(7):  # Per ogni colonna (da 0 a 6)
             for j in range(i + 1):  # La colonna i riceve i+1 carte
                 carta = mazzo.pesca()  # Pesca una carta dal mazzo
                 carta.coperta = (j != i)  # Solo l'ultima carta è scoperta
+                if carta.coperta:
+                    self.coperte[i] += 1  # Aggiorna il contatore delle coperte
                 self.colonne[i].append(carta)  # Aggiunge la carta alla colonna
 
     def mostra(self):
         spazio = "                "  # Spazi tra le colonne
-        max_len = max(len(col) for col in self.colonne)  # Trova la lunghezza massima tra tutte le colonne (serve per sapere quante righe stampare)
+        colonne = self.colonne  # Lookup dell'attributo una sola volta per tutto il disegno
+        max_len = max(len(col) for col in colonne)  # Trova la lunghezza massima tra tutte le colonne (serve per sapere quante righe stampare)
+        righe = []  # Righe del tavolo, accumulate per stamparle con una sola chiamata
         for r in range(max_len):  # Cicla su ogni riga da stampare (fino alla colonna più lunga)
-            riga = ""  # Inizializza la stringa della riga corrente
-            for col in self.colonne:  # Cicla su ogni colonna del tavolo
+            celle = []  # Celle della riga corrente, concatenate alla fine con un unico join
+            for col in colonne:  # Cicla su ogni colonna del tavolo
                 if r < len(col):  # Se la colonna ha una carta in questa riga
-                    carta_str = str(col[r])  # Ottiene la stringa della carta (colorata o no)
-                    visibile = strip_ansi(carta_str)  # Rimuove i codici ANSI per calcolare la lunghezza visibile della carta
-                    spazi = 6 - len(visibile)  # Calcola quanti spazi servono per arrivare a 6 caratteri visibili
-                    riga += carta_str + (" " * spazi) + spazio  # Aggiunge la carta, gli spazi necessari e lo spazio tra colonne
+                    carta = col[r]  # Carta da disegnare in questa cella
+                    larghezza = 3 if carta.coperta else len(carta.testo)  # Larghezza visibile: "[#]" oppure il testo precalcolato, senza passare da strip_ansi
+                    celle.append(str(carta) + " " * (6 - larghezza) + spazio)  # Carta, spazi di allineamento e spazio tra colonne
                 else:
-                    riga += " " * 6 + spazio  # Se la colonna è più corta, aggiunge solo spazi vuoti per mantenere l'allineamento
-            print(riga)  # Stampa la riga completa con tutte le colonne
+                    celle.append(" " * 6 + spazio)  # Se la colonna è più corta, aggiunge solo spazi vuoti per mantenere l'allineamento
+            righe.append("".join(celle))  # Compone la riga con un join unico invece di tante concatenazioni
+        sys.stdout.write("\n".join(righe) + "\n")  # Un'unica scrittura per tutto il tavolo invece di una print per riga
 
     def scopri_se_necessario(self, col_idx):
         # Scopre la carta in cima se è coperta
-        if self.colonne[col_idx]:  # Se la colonna non è vuota
-            if self.colonne[col_idx][-1].coperta:  # Se la carta in cima è coperta
-                self.colonne[col_idx][-1].coperta = False  # Scoprila
+        colonna = self.colonne[col_idx]  # Lookup della colonna una sola volta
+        if colonna:  # Se la colonna non è vuota
+            if colonna[-1].coperta:  # Se la carta in cima è coperta
+                colonna[-1].coperta = False  # Scoprila
+                self.coperte[col_idx] -= 1  # La frontiera delle carte coperte arretra di uno
 
     def sposta_carte(self, da_col, a_col, num_carte):
         # Sposta num_carte dalla colonna da_col alla colonna a_col
         if not (0 <= da_col < 7 and 0 <= a_col < 7):  # Indici validi?
             return False
-        if len(self.colonne[da_col]) < num_carte:  # Abbastanza carte da spostare?
+        if num_carte < 1:  # Serve almeno una carta da spostare
             return False
-        carte_da_spostare = self.colonne[da_col][-num_carte:]  # Prendi le carte da spostare
-        if not all(not carta.coperta for carta in carte_da_spostare):  # Tutte scoperte?
+        colonna_da = self.colonne[da_col]  # Colonna di partenza (lookup unico)
+        colonna_a = self.colonne[a_col]    # Colonna di destinazione (lookup unico)
+        if num_carte > len(colonna_da) - self.coperte[da_col]:  # Il blocco sconfina nelle carte coperte (o è più lungo della colonna)?
             return False
-        if not self.colonne[a_col]:  # Se la colonna di destinazione è vuota
-            if carte_da_spostare[0].valore != 'K':  # Solo un Re può andare su una colonna vuota
+        prima_carta = colonna_da[-num_carte]  # Prima carta del blocco da spostare
+        if not colonna_a:  # Se la colonna di destinazione è vuota
+            if prima_carta.rank != 12:  # Solo un Re può andare su una colonna vuota
                 return False
         else:
-            carta_destinazione = self.colonne[a_col][-1]  # Carta in cima alla destinazione
-            # Regole: colori alternati e valore decrescente
-            if carta_destinazione.colore() == carte_da_spostare[0].colore() or carta_destinazione.valore_num() != carte_da_spostare[0].valore_num() + 1:
+            if not puo_impilare(prima_carta, colonna_a[-1]):  # Colori alternati e valore decrescente
                 return False
-        self.colonne[a_col].extend(carte_da_spostare)  # Aggiungi le carte alla destinazione
-        self.colonne[da_col] = self.colonne[da_col][:-num_carte]  # Rimuovi dalla partenza
+        colonna_a.extend(colonna_da[-num_carte:])  # Aggiungi le carte alla destinazione
+        del colonna_da[-num_carte:]  # Rimuovi dalla partenza (in place, senza ricreare la lista)
         self.scopri_se_necessario(da_col)  # Scopri la nuova carta in cima se necessario
         return True  # Spostamento riuscito
 
     def aggiungi_da_mazzo(self, carta):
         # Aggiunge una carta dal mazzo a una colonna
-        for col_idx in range(7):  # Prova tutte le colonne
-            if not self.colonne[col_idx]:  # Se la colonna è vuota
-                if carta.valore == 'K':  # Solo un Re può andare su una colonna vuota
-                    self.colonne[col_idx].append(carta)
+        for colonna in self.colonne:  # Prova tutte le colonne
+            if not colonna:  # Se la colonna è vuota
+                if carta.rank == 12:  # Solo un Re può andare su una colonna vuota
+                    colonna.append(carta)
                     return True
             else:
-                carta_destinazione = self.colonne[col_idx][-1]  # Carta in cima
-                if carta_destinazione.colore() != carta.colore() and carta_destinazione.valore_num() == carta.valore_num() + 1:
-                    self.colonne[col_idx].append(carta)
+                if puo_impilare(carta, colonna[-1]):  # Carta in cima compatibile?
+                    colonna.append(carta)
                     return True
         return False  # Nessuna colonna valida trovata
 
@@ -155,14 +206,14 @@ class Tavolo:
         # Aggiunge una carta dal mazzo a una colonna specifica
         if not (0 <= col_idx < 7):  # Indice valido?
             return False
-        if not self.colonne[col_idx]:  # Se la colonna è vuota
-            if carta.valore == 'K':  # Solo un Re può andare su una colonna vuota
-                self.colonne[col_idx].append(carta)
+        colonna = self.colonne[col_idx]  # Lookup della colonna una sola volta
+        if not colonna:  # Se la colonna è vuota
+            if carta.rank == 12:  # Solo un Re può andare su una colonna vuota
+                colonna.append(carta)
                 return True
         else:
-            carta_destinazione = self.colonne[col_idx][-1]  # Carta in cima
-            if carta_destinazione.colore() != carta.colore() and carta_destinazione.valore_num() == carta.valore_num() + 1:
-                self.colonne[col_idx].append(carta)
+            if puo_impilare(carta, colonna[-1]):  # Carta in cima compatibile?
+                colonna.append(carta)
                 return True
         return False  # Mossa non valida
 
@@ -171,25 +222,32 @@ class Tavolo:
 # --- Classe Pile Finali (fondazioni) ---
 # =============================================================================
 class Finali:
+    __slots__ = ('pile', 'totale')  # Niente __dict__ per istanza
+
     def __init__(self):
         self.pile = {seme: [] for seme in SEMI}  # Crea un dizionario con una pila vuota per ogni seme (♠, ♥, ♦, ♣)
+        self.totale = 0  # Contatore incrementale delle carte nelle fondazioni (0-52)
 
     def mostra(self):
+        parti = []  # Pezzi della riga delle fondazioni, stampati poi in un colpo solo
         for seme in SEMI:  # Cicla su tutti i semi
-            if self.pile[seme]:  # Se la pila per quel seme contiene almeno una carta
-                carta = self.pile[seme][-1]  # Prende la carta in cima alla pila (l'ultima aggiunta)
-                print(f"{seme}: [{carta.valore}{carta.seme}]", end="    ")  # Stampa il seme e la carta in cima
+            pila = self.pile[seme]  # Lookup del dizionario una sola volta per seme
+            if pila:  # Se la pila per quel seme contiene almeno una carta
+                carta = pila[-1]  # Prende la carta in cima alla pila (l'ultima aggiunta)
+                parti.append(f"{seme}: [{carta.valore}{carta.seme}]")  # Seme e carta in cima
             else:
-                print(f"{seme}: [  ]", end="    ")  # Se la pila è vuota, stampa solo il seme e uno spazio vuoto
-        print()  # Va a capo dopo aver stampato tutte le pile
+                parti.append(f"{seme}: [  ]")  # Se la pila è vuota, mostra solo il seme e uno spazio vuoto
+        print("    ".join(parti))  # Un'unica print per tutta la riga delle fondazioni
 
     def aggiungi(self, carta):
         pila = self.pile[carta.seme]  # Prende la pila corrispondente al seme della carta
-        if not pila and carta.valore == 'A':  # Se la pila è vuota, solo un Asso può essere aggiunto
+        if not pila and carta.rank == 0:  # Se la pila è vuota, solo un Asso può essere aggiunto
             pila.append(carta)
+            self.totale += 1  # Aggiorna il contatore incrementale
             return True
-        elif pila and carta.valore_num() == pila[-1].valore_num() + 1:  # Se la pila ha carte, la carta deve essere la successiva
+        elif pila and carta.rank == pila[-1].rank + 1:  # Se la pila ha carte, la carta deve essere la successiva
             pila.append(carta)
+            self.totale += 1  # Aggiorna il contatore incrementale
             return True
         return False  # Altrimenti la carta non può essere aggiunta
 
@@ -205,7 +263,7 @@ class Finali:
         return False  # Spostamento non possibile
 
     def vittoria(self):
-        return all(len(self.pile[seme]) == 13 for seme in SEMI)
+        return self.totale == 52  # Confronto O(1) sul contatore invece di rileggere le quattro pile
 
 
 # =============================================================================
@@ -219,12 +277,128 @@ def main():
     riserva = []  # Lista per le carte pescate dal mazzo
     scarti = []  # Lista per le carte scartate (non usata in questa versione)
     messaggio = ""  # Stringa per messaggi all'utente
+    ridisegna = True  # Flag "dirty": il tavolo viene ridisegnato solo quando lo stato di gioco è cambiato
+
+    # --- Funzioni comando ---
+    # Ognuna esegue un'azione e restituisce True se ha modificato lo stato di
+    # gioco (e quindi serve un ridisegno). Gli argomenti numerici possono
+    # arrivare dalla riga di comando (es. "s 0 3 2"); quelli mancanti vengono
+    # chiesti all'utente come prima.
+
+    def cmd_pesca():
+        nonlocal messaggio
+        if not mazzo.vuoto():  # Se il mazzo non è vuoto
+            carta = mazzo.pesca()  # Pesca una carta dal mazzo
+            carta.coperta = False  # La carta pescata è sempre scoperta
+            riserva.append(carta)  # Aggiunge la carta alla riserva
+            messaggio = f"Hai pescato: {carta}"  # Messaggio di conferma
+            return True
+        # --- GESTIONE MAZZO VUOTO ---
+        if scarti:  # Se ci sono carte negli scarti, rimescola automaticamente
+            messaggio = "Mazzo finito! Rimescolo automaticamente gli scarti."
+            mazzo.rimescola(scarti)  # Rimescola gli scarti nel mazzo (scarti viene svuotato automaticamente)
+            return True
+        if riserva:  # Se non ci sono scarti ma c'è una carta in riserva, spostala negli scarti
+            messaggio = "Mazzo finito! Sposta la carta in riserva negli scarti e usa comando [r] per rimescolare."
+        else:
+            messaggio = "Mazzo, riserva e scarti vuoti! Nessuna carta disponibile."  # Nessuna carta disponibile
+        return False
+
+    def cmd_sposta(da_col=None, a_col=None, num_carte=None):
+        # Sposta carte tra colonne
+        if da_col is None:
+            da_col = int(input("Da colonna (0-6): "))  # Chiede la colonna di partenza
+        if a_col is None:
+            a_col = int(input("A colonna (0-6): "))    # Chiede la colonna di destinazione
+        if num_carte is None:
+            num_carte = int(input("Numero di carte da spostare: "))  # Quante carte spostare
+        if tavolo.sposta_carte(da_col, a_col, num_carte):  # Tenta lo spostamento
+            print("Mossa valida!")  # Conferma se la mossa è valida
+            return True
+        print("Mossa non valida!")  # Messaggio di errore se la mossa non è valida
+        return False
+
+    def cmd_verso_finali(col_idx=None):
+        # Sposta carta verso le fondazioni
+        if col_idx is None:
+            col_idx = int(input("Colonna (0-6): "))  # Chiede la colonna da cui spostare
+        if finali.sposta_verso_finali(tavolo, col_idx):  # Tenta lo spostamento verso le fondazioni
+            print("Carta spostata verso le fondazioni!")  # Conferma se la mossa è valida
+            return True
+        print("Mossa non valida!")  # Messaggio di errore se la mossa non è valida
+        return False
+
+    def cmd_mazzo_colonna(col_idx=None):
+        # Sposta carta dal mazzo (riserva) alle colonne
+        if not riserva:
+            print("Riserva vuota! Pesca prima una carta.")  # Messaggio se la riserva è vuota
+            return False
+        carta = riserva[-1]  # Prende l'ultima carta pescata
+        print(f"Carta da spostare: {carta}")  # Mostra la carta da spostare
+        if col_idx is None:
+            col_idx = int(input("In quale colonna? (0-6): "))  # Chiede la colonna di destinazione
+        if tavolo.aggiungi_da_mazzo_a_colonna(carta, col_idx):  # Tenta di aggiungere la carta
+            riserva.pop()  # Rimuove la carta dalla riserva
+            print(f"Carta {carta} spostata dal mazzo alla colonna {col_idx}!")  # Conferma
+            return True
+        print("Mossa non valida! La carta non può essere messa in quella colonna.")  # Errore regole
+        return False
+
+    def cmd_mazzo_finali():
+        # Sposta carta dal mazzo (riserva) alle fondazioni
+        if not riserva:
+            print("Riserva vuota! Pesca prima una carta.")  # Messaggio se la riserva è vuota
+            return False
+        carta = riserva[-1]  # Prende l'ultima carta pescata
+        if finali.aggiungi(carta):  # Tenta di aggiungere la carta alle fondazioni
+            riserva.pop()  # Rimuove la carta dalla riserva
+            print(f"Carta {carta} spostata dal mazzo alle fondazioni!")  # Conferma
+            return True
+        print("Mossa non valida!")  # Messaggio di errore se la mossa non è valida
+        return False
+
+    def cmd_scarta():
+        # --- SCARTA CARTA DALLA RISERVA ---
+        nonlocal messaggio
+        if not riserva:  # Se la riserva è vuota
+            print("Riserva vuota! Non c'è niente da scartare.")  # Messaggio di errore
+            return False
+        carta_da_scartare = riserva.pop()  # Rimuove l'ultima carta dalla riserva
+        mazzo.aggiungi_scarto(carta_da_scartare, scarti)  # La aggiunge agli scarti
+        messaggio = f"Carta {carta_da_scartare} scartata."  # Messaggio di conferma
+        return True
+
+    def cmd_rimescola():
+        # --- RIMESCOLA SCARTI MANUALMENTE ---
+        nonlocal messaggio
+        if not scarti:  # Se non ci sono scarti
+            print("Nessuna carta negli scarti da rimescolare!")  # Messaggio di errore
+            return False
+        if not mazzo.vuoto():  # Se il mazzo non è ancora vuoto
+            print("Il mazzo non è vuoto! Puoi rimescolare solo quando il mazzo è finito.")  # Messaggio di errore
+            return False
+        mazzo.rimescola(scarti)  # Rimescola gli scarti nel mazzo
+        messaggio = f"Rimescolate {len(mazzo.carte)} carte dagli scarti nel mazzo!"  # Messaggio di conferma
+        return True
+
+    # Tabella di dispatch: sostituisce la catena di if/elif e permette di dare
+    # comando e argomenti in un'unica riga, con una sola input() per mossa
+    comandi = {
+        "p": cmd_pesca,
+        "s": cmd_sposta,
+        "f": cmd_verso_finali,
+        "m": cmd_mazzo_colonna,
+        "mf": cmd_mazzo_finali,
+        "sc": cmd_scarta,
+        "r": cmd_rimescola,
+    }
 
     while True:  # Ciclo principale del gioco
-        print("\n--- TAVOLO ---")
-        tavolo.mostra()  # Visualizza le colonne del tavolo
-        print("\n--- PILE FINALI ---")
-        finali.mostra()  # Visualizza le pile finali
+        if ridisegna:  # Ridisegna lo schermo solo dopo una mossa andata a buon fine
+            print("\n--- TAVOLO ---")
+            tavolo.mostra()  # Visualizza le colonne del tavolo
+            print("\n--- PILE FINALI ---")
+            finali.mostra()  # Visualizza le pile finali
         if messaggio:  # Se c'è un messaggio da mostrare
             print(messaggio)
             messaggio = ""  # Pulisce il messaggio dopo averlo mostrato
@@ -232,110 +406,43 @@ def main():
         if finali.vittoria():
             print("Vittoria!")
             break
-        # --- MOSTRA INFORMAZIONI AGGIUNTIVE ---
-        carte_rimaste = mazzo.conta_carte_totali(riserva, scarti)  # Conta tutte le carte disponibili
-        print(f"\nCarte disponibili: Mazzo({len(mazzo.carte)}) + Riserva({len(riserva)}) + Scarti({len(scarti)}) = {carte_rimaste}")
-        
-        # --- MOSTRA CARTA IN RISERVA SE PRESENTE ---
-        if riserva:  # Se c'è almeno una carta in riserva
-            print(f"Carta in riserva: {riserva[-1]}")  # Mostra l'ultima carta pescata (quella utilizzabile)
-        
-        # --- MOSTRA SCARTI SE PRESENTI (solo per debug) ---
-        if scarti and len(scarti) <= 5:  # Mostra gli scarti solo se sono pochi (per non intasare l'output)
-            print(f"Scarti: {[str(carta) for carta in scarti]}")  # Mostra tutte le carte negli scarti
-        elif scarti:  # Se ci sono molti scarti, mostra solo il conteggio
-            print(f"Scarti: {len(scarti)} carte (troppe per essere mostrate)")
-        
-        print("\nComandi: [p] Pesca  [s] Sposta  [f] Sposta verso finali  [m] da Mazzo a colonne  [mf] da Mazzo a finali")
-        print("         [sc] Scarta carta riserva  [r] Rimescola scarti  [q] Esci")
-        cmd = input("Comando: ").strip().lower()  # Chiede il comando all'utente
+        if ridisegna:  # Anche le informazioni aggiuntive cambiano solo insieme allo stato
+            # --- MOSTRA INFORMAZIONI AGGIUNTIVE ---
+            n_mazzo, n_riserva, n_scarti = len(mazzo.carte), len(riserva), len(scarti)  # Conteggi letti una volta sola
+            carte_rimaste = n_mazzo + n_riserva + n_scarti  # Totale delle carte disponibili (somma diretta, senza passare dal metodo)
+            print(f"\nCarte disponibili: Mazzo({n_mazzo}) + Riserva({n_riserva}) + Scarti({n_scarti}) = {carte_rimaste}")
+
+            # --- MOSTRA CARTA IN RISERVA SE PRESENTE ---
+            if riserva:  # Se c'è almeno una carta in riserva
+                print(f"Carta in riserva: {riserva[-1]}")  # Mostra l'ultima carta pescata (quella utilizzabile)
+
+            # --- MOSTRA SCARTI SE PRESENTI (solo per debug) ---
+            if scarti and n_scarti <= 5:  # Mostra gli scarti solo se sono pochi (per non intasare l'output)
+                print(f"Scarti: {[str(carta) for carta in scarti]}")  # Mostra tutte le carte negli scarti
+            elif scarti:  # Se ci sono molti scarti, mostra solo il conteggio
+                print(f"Scarti: {n_scarti} carte (troppe per essere mostrate)")
+
+            print("\nComandi: [p] Pesca  [s] Sposta  [f] Sposta verso finali  [m] da Mazzo a colonne  [mf] da Mazzo a finali\n"
+                  "         [sc] Scarta carta riserva  [r] Rimescola scarti  [q] Esci")
+        ridisegna = False  # Torna "pulito": saranno i comandi che modificano lo stato a rimetterlo a True
+        parti = input("Comando: ").strip().lower().split()  # Comando ed eventuali argomenti numerici sulla stessa riga
+        if not parti:  # Riga vuota: torna al prompt
+            continue
+        cmd = parti[0]
 
         if cmd == "q":
             print("Arrivederci!")
             break  # Esce dal ciclo e termina il gioco
-        elif cmd == "p":
-            if not mazzo.vuoto():  # Se il mazzo non è vuoto
-                carta = mazzo.pesca()  # Pesca una carta dal mazzo
-                carta.coperta = False  # La carta pescata è sempre scoperta
-                riserva.append(carta)  # Aggiunge la carta alla riserva
-                messaggio = f"Hai pescato: {carta}"  # Messaggio di conferma
-            else:
-                # --- GESTIONE MAZZO VUOTO ---
-                if scarti:  # Se ci sono carte negli scarti, rimescola automaticamente
-                    messaggio = "Mazzo finito! Rimescolo automaticamente gli scarti."
-                    mazzo.rimescola(scarti)  # Rimescola gli scarti nel mazzo (scarti viene svuotato automaticamente)
-                elif riserva:  # Se non ci sono scarti ma c'è una carta in riserva, spostala negli scarti
-                    messaggio = "Mazzo finito! Sposta la carta in riserva negli scarti e usa comando [r] per rimescolare."
-                else:
-                    messaggio = "Mazzo, riserva e scarti vuoti! Nessuna carta disponibile."  # Nessuna carta disponibile
-        elif cmd == "s":
-            # Sposta carte tra colonne
-            try:
-                da_col = int(input("Da colonna (0-6): "))  # Chiede la colonna di partenza
-                a_col = int(input("A colonna (0-6): "))    # Chiede la colonna di destinazione
-                num_carte = int(input("Numero di carte da spostare: "))  # Quante carte spostare
-                if tavolo.sposta_carte(da_col, a_col, num_carte):  # Tenta lo spostamento
-                    print("Mossa valida!")  # Conferma se la mossa è valida
-                else:
-                    print("Mossa non valida!")  # Messaggio di errore se la mossa non è valida
-            except ValueError:
-                print("Input non valido!")  # Messaggio di errore se l'input non è un numero
-        elif cmd == "f":
-            # Sposta carta verso le fondazioni
-            try:
-                col_idx = int(input("Colonna (0-6): "))  # Chiede la colonna da cui spostare
-                if finali.sposta_verso_finali(tavolo, col_idx):  # Tenta lo spostamento verso le fondazioni
-                    print("Carta spostata verso le fondazioni!")  # Conferma se la mossa è valida
-                else:
-                    print("Mossa non valida!")  # Messaggio di errore se la mossa non è valida
-            except ValueError:
-                print("Input non valido!")  # Messaggio di errore se l'input non è un numero
-        elif cmd == "m":
-            # Sposta carta dal mazzo (riserva) alle colonne
-            if not riserva:
-                print("Riserva vuota! Pesca prima una carta.")  # Messaggio se la riserva è vuota
-            else:
-                carta = riserva[-1]  # Prende l'ultima carta pescata
-                print(f"Carta da spostare: {carta}")  # Mostra la carta da spostare
-                try:
-                    col_idx = int(input("In quale colonna? (0-6): "))  # Chiede la colonna di destinazione
-                    if tavolo.aggiungi_da_mazzo_a_colonna(carta, col_idx):  # Tenta di aggiungere la carta
-                        riserva.pop()  # Rimuove la carta dalla riserva
-                        print(f"Carta {carta} spostata dal mazzo alla colonna {col_idx}!")  # Conferma
-                    else:
-                        print("Mossa non valida! La carta non può essere messa in quella colonna.")  # Errore regole
-                except ValueError:
-                    print("Input non valido! Inserisci un numero da 0 a 6.")  # Errore input non numerico
-        elif cmd == "mf":
-            # Sposta carta dal mazzo (riserva) alle fondazioni
-            if not riserva:
-                print("Riserva vuota! Pesca prima una carta.")  # Messaggio se la riserva è vuota
-            else:
-                carta = riserva[-1]  # Prende l'ultima carta pescata
-                if finali.aggiungi(carta):  # Tenta di aggiungere la carta alle fondazioni
-                    riserva.pop()  # Rimuove la carta dalla riserva
-                    print(f"Carta {carta} spostata dal mazzo alle fondazioni!")  # Conferma
-                else:
-                    print("Mossa non valida!")  # Messaggio di errore se la mossa non è valida
-        elif cmd == "sc":
-            # --- SCARTA CARTA DALLA RISERVA ---
-            if not riserva:  # Se la riserva è vuota
-                print("Riserva vuota! Non c'è niente da scartare.")  # Messaggio di errore
-            else:
-                carta_da_scartare = riserva.pop()  # Rimuove l'ultima carta dalla riserva
-                mazzo.aggiungi_scarto(carta_da_scartare, scarti)  # La aggiunge agli scarti
-                messaggio = f"Carta {carta_da_scartare} scartata."  # Messaggio di conferma
-        elif cmd == "r":
-            # --- RIMESCOLA SCARTI MANUALMENTE ---
-            if not scarti:  # Se non ci sono scarti
-                print("Nessuna carta negli scarti da rimescolare!")  # Messaggio di errore
-            elif not mazzo.vuoto():  # Se il mazzo non è ancora vuoto
-                print("Il mazzo non è vuoto! Puoi rimescolare solo quando il mazzo è finito.")  # Messaggio di errore
-            else:
-                mazzo.rimescola(scarti)  # Rimescola gli scarti nel mazzo
-                messaggio = f"Rimescolate {len(mazzo.carte)} carte dagli scarti nel mazzo!"  # Messaggio di conferma
-        else:
+        azione = comandi.get(cmd)  # Cerca il comando nella tabella di dispatch
+        if azione is None:
             print("Comando non riconosciuto.")  # Messaggio per comando non valido
+            continue
+        try:
+            argomenti = [int(n) for n in parti[1:]]  # Gli argomenti dei comandi sono sempre numeri
+            if azione(*argomenti):  # Esegue il comando: True se lo stato di gioco è cambiato
+                ridisegna = True
+        except (ValueError, TypeError):
+            print("Input non valido!")  # Input non numerico o numero di argomenti sbagliato
 
 def colora_seme(seme):
     # Restituisce il seme colorato: rosso per cuori e quadri, bianco per picche e fiori
@@ -344,10 +451,12 @@ def colora_seme(seme):
     else:
         return Fore.WHITE + seme + Style.RESET_ALL  # Colora di bianco il seme e resetta lo stile dopo
 
+# Regex dei codici di escape ANSI, compilata una volta sola all'import
+ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
 def strip_ansi(text):
     # Rimuove i codici di escape ANSI (usati per i colori) da una stringa
-    ansi_escape = re.compile(r'\x1b\[[0-9;]*m')  # Regex che trova i codici ANSI
-    return ansi_escape.sub('', text)  # Restituisce la stringa senza codici ANSI
+    return ANSI_RE.sub('', text)  # Restituisce la stringa senza codici ANSI
 
 if __name__ == "__main__":
     # Punto di ingresso del programma: esegue main() solo se il file è eseguito direttamente